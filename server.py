@@ -1,16 +1,27 @@
 from fastapi import FastAPI, HTTPException, Query, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, HTMLResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, Response
 from motor.motor_asyncio import AsyncIOMotorClient
-from pydantic import BaseModel, Field
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument, UpdateOne
+from pymongo.errors import PyMongoError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional
-from datetime import datetime
-from bson import ObjectId
+from datetime import datetime, timezone
+from bson import ObjectId, decode_all
+from bson.errors import InvalidId
 import os
+import base64
+import hmac
 import logging
+import time
 from pathlib import Path
 from contextlib import asynccontextmanager
+from functools import wraps
+import orjson
 
 # Configure logging
 logging.basicConfig(
@@ -23,42 +34,91 @@ logger = logging.getLogger(__name__)
 MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
 DB_NAME = os.environ.get('DB_NAME', 'unhinged_listings')
 ADMIN_PASSWORD = os.environ.get('ADMIN_PASSWORD', 'changeme')
+# Size the pool for at least the expected number of concurrent requests so
+# queries don't queue behind busy connections; waiters give up after 2s
+# rather than hanging the request.
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', '100'))
+
+# Comma-separated origins allowed to call the API cross-origin
+FRONTEND_ORIGIN = os.environ.get('FRONTEND_ORIGIN', 'http://localhost:3000')
+
+# Redis response cache (optional — caching is skipped when REDIS_URL is unset)
+REDIS_URL = os.environ.get('REDIS_URL', '')
+CACHE_STALE_TTL = 24 * 60 * 60  # how long the last-known response survives for outages
+
+# Bumped on every listing write; used as the /api/listings ETag and in the
+# listing cache keys, so a cached body always matches its version. Other
+# worker processes re-read it from db.meta at most every LISTINGS_VERSION_TTL
+# seconds.
+LISTINGS_VERSION_TTL = 5
+listings_version = 0
+_listings_version_at = 0.0
 
 # Database client (initialized on startup)
 client = None
 db = None
+cache = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage database connection lifecycle."""
-    global client, db
-    client = AsyncIOMotorClient(MONGO_URL)
+    global client, db, cache
+    client = AsyncIOMotorClient(
+        MONGO_URL,
+        maxPoolSize=MONGO_MAX_POOL_SIZE,
+        minPoolSize=min(10, MONGO_MAX_POOL_SIZE),
+        waitQueueTimeoutMS=2000,
+        serverSelectionTimeoutMS=3000,
+    )
     db = client[DB_NAME]
     logger.info("Connected to MongoDB")
-    # Create indexes
-    await db.listings.create_index("category")
-    await db.listings.create_index([("sortOrder", 1)])
-    await db.listings.create_index([("postedDate", -1)])
-    # Seed if empty
-    count = await db.listings.count_documents({})
-    if count == 0:
+    if REDIS_URL:
+        cache = Redis.from_url(REDIS_URL)
+        logger.info("Connected to Redis")
+    # Create indexes in one round-trip. The compound indexes match the
+    # listings query: optional category equality, then sortOrder/_id order,
+    # so pages come straight off the index.
+    await db.listings.create_indexes([
+        IndexModel([("category", ASCENDING), ("sortOrder", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("sortOrder", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("postedDate", DESCENDING)]),
+    ])
+    # Seed if empty. Only the worker whose upsert creates the sentinel seeds,
+    # so concurrent startups can't insert the listings twice.
+    sentinel = await db.meta.update_one(
+        {"_id": "seeded"},
+        {"$setOnInsert": {"done": True}},
+        upsert=True
+    )
+    if sentinel.upserted_id is not None and await db.listings.count_documents({}) == 0:
         logger.info("Database empty — seeding initial listings...")
         await seed_initial_data()
+    await sync_sort_counter("listings_sortOrder", db.listings)
+    await sync_sort_counter("missed_connections_sortOrder", db.missed_connections)
+    await current_listings_version()
     yield
+    if cache is not None:
+        await cache.aclose()
+        logger.info("Disconnected from Redis")
     client.close()
     logger.info("Disconnected from MongoDB")
 
 
-app = FastAPI(title="Unhinged Listings", lifespan=lifespan)
+# orjson encodes datetimes natively, so the *_to_dict helpers return them
+# as-is. Routes that return a plain dict still go through FastAPI's
+# jsonable_encoder first; the read routes return ORJSONResponse (or raw
+# bytes) directly to skip that pass.
+app = FastAPI(title="Unhinged Listings", lifespan=lifespan, default_response_class=ORJSONResponse)
 
-# CORS
+# CORS — only needed when the frontend is hosted on another origin; the
+# bundled frontend is same-origin and never triggers it
 app.add_middleware(
     CORSMiddleware,
-    allow_credentials=True,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_credentials=False,
+    allow_origins=[o.strip() for o in FRONTEND_ORIGIN.split(",") if o.strip()],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["content-type"],
 )
 
 
@@ -77,7 +137,18 @@ class ListingCreate(BaseModel):
     postedDate: Optional[str] = None  # ISO date string, defaults to now
 
 
-class ListingUpdate(BaseModel):
+class PartialUpdate(BaseModel):
+    """Update body where fields may be omitted but not set to null."""
+
+    @field_validator("*")
+    @classmethod
+    def reject_null(cls, value):
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
+
+
+class ListingUpdate(PartialUpdate):
     title: Optional[str] = None
     price: Optional[float] = None
     status: Optional[str] = None
@@ -100,7 +171,7 @@ class MissedConnectionCreate(BaseModel):
     postedDate: Optional[str] = None
 
 
-class MissedConnectionUpdate(BaseModel):
+class MissedConnectionUpdate(PartialUpdate):
     title: Optional[str] = None
     fullText: Optional[str] = None
     location: Optional[str] = None
@@ -108,7 +179,14 @@ class MissedConnectionUpdate(BaseModel):
 
 # --- Helpers ---
 
-def listing_to_dict(listing) -> dict:
+# List views never show fullText, which dominates document size. updatedAt
+# stays in so _cachedJson backfills can check the doc hasn't changed.
+LIST_PROJECTION = {"fullText": 0}
+# _cachedJson is only read by list views
+DETAIL_PROJECTION = {"_cachedJson": 0}
+
+
+def listing_to_list_dict(listing) -> dict:
     return {
         "id": str(listing["_id"]),
         "title": listing["title"],
@@ -116,38 +194,329 @@ def listing_to_dict(listing) -> dict:
         "status": listing["status"],
         "image": listing.get("image", ""),
         "excerpt": listing["excerpt"],
-        "fullText": listing["fullText"],
         "facebookUrl": listing.get("facebookUrl", ""),
         "category": listing["category"],
         "location": listing.get("location", "Colorado Springs, CO"),
-        "postedDate": listing["postedDate"].isoformat() if isinstance(listing["postedDate"], datetime) else listing["postedDate"],
-        "createdAt": listing.get("createdAt", listing["postedDate"]).isoformat() if isinstance(listing.get("createdAt", listing["postedDate"]), datetime) else str(listing.get("createdAt", "")),
+        "postedDate": listing["postedDate"],
+        "createdAt": listing.get("createdAt", listing["postedDate"]),
         "sortOrder": listing.get("sortOrder", 999),
     }
 
 
+def listing_to_dict(listing) -> dict:
+    return {**listing_to_list_dict(listing), "fullText": listing["fullText"]}
+
+
+def bson_datetime(value: datetime) -> datetime:
+    """Normalize a datetime to what BSON stores: naive UTC, millisecond precision.
+
+    Documents echoed back or serialized into _cachedJson then match what
+    later reads of the same fields return.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.replace(microsecond=value.microsecond // 1000 * 1000)
+
+
+def utcnow() -> datetime:
+    return bson_datetime(datetime.utcnow())
+
+
+def listing_json(listing) -> bytes:
+    """List-view JSON for a listing, precomputed into _cachedJson on write.
+
+    Edits and reorders unset _cachedJson, so documents without it are
+    serialized on the fly (and backfilled by listings_page on the next read).
+    """
+    return listing.get("_cachedJson") or orjson.dumps(listing_to_list_dict(listing))
+
+
+def to_oid(value, status_code: int = 404, detail: str = "Listing not found") -> ObjectId:
+    """Parse an ObjectId string, raising HTTPException if it isn't one."""
+    # ObjectId(None) mints a fresh id and ObjectId(bytes) takes raw bytes,
+    # so only hex strings are accepted
+    if not isinstance(value, str):
+        raise HTTPException(status_code=status_code, detail=detail)
+    try:
+        return ObjectId(value)
+    except InvalidId:
+        raise HTTPException(status_code=status_code, detail=detail)
+
+
+def encode_cursor(listing) -> str:
+    """Encode the (sortOrder, _id) keyset of the last listing on a page."""
+    sort_order = listing.get("sortOrder")
+    raw = f'{"" if sort_order is None else sort_order}:{listing["_id"]}'
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(token: str) -> dict:
+    """Turn a cursor from encode_cursor into a query for the listings after it."""
+    try:
+        sort_part, oid = base64.urlsafe_b64decode(token.encode()).decode().split(":", 1)
+        sort_order = int(sort_part) if sort_part else None
+        oid = ObjectId(oid)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if sort_order is None:
+        # Listings without a sortOrder sort first; page through them by _id
+        return {"$or": [
+            {"sortOrder": None, "_id": {"$gt": oid}},
+            {"sortOrder": {"$ne": None}},
+        ]}
+    return {"$or": [
+        {"sortOrder": {"$gt": sort_order}},
+        {"sortOrder": sort_order, "_id": {"$gt": oid}},
+    ]}
+
+
+async def next_sort_order(counter_id: str) -> int:
+    """Atomically claim the next sortOrder from a counter doc."""
+    counter = await db.counters.find_one_and_update(
+        {"_id": counter_id},
+        {"$inc": {"seq": 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    return counter["seq"]
+
+
+async def sync_sort_counter(counter_id: str, collection):
+    """Make sure a sortOrder counter is at least the collection's current max."""
+    last = await collection.find_one(
+        {"sortOrder": {"$ne": None}}, projection={"sortOrder": 1}, sort=[("sortOrder", -1)]
+    )
+    if last:
+        await db.counters.update_one(
+            {"_id": counter_id},
+            {"$max": {"seq": last["sortOrder"]}},
+            upsert=True
+        )
+
+
 def verify_admin(password: str):
-    if password != ADMIN_PASSWORD:
+    if not hmac.compare_digest(password.encode(), ADMIN_PASSWORD.encode()):
         raise HTTPException(status_code=401, detail="Invalid password")
 
 
+def require_admin(password: str = Query(...)):
+    """Dependency guarding admin routes on the ?password= query param."""
+    verify_admin(password)
+
+
+# --- Response Cache ---
+
+def json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+def as_response(result) -> Response:
+    """Wrap a handler result so FastAPI skips jsonable_encoder."""
+    return result if isinstance(result, Response) else ORJSONResponse(result)
+
+
+def cached(ttl: int, key: str, stale_key: Optional[str] = None, keep_stale=None, etag=None):
+    """Cache an endpoint's JSON body in Redis for `ttl` seconds.
+
+    `key` and `stale_key` are formatted with the handler's arguments (None
+    becomes "all"). When `stale_key` is given, a longer-lived "stale:" copy
+    is kept under it so a Mongo outage still serves the last-known response
+    instead of an error; `keep_stale`, if given, is called with the arguments
+    and can skip that copy. `etag`, if given, is called with the arguments
+    and its value is sent (and stored with the stale copy) as the ETag.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(**kwargs):
+            if cache is None:
+                return as_response(await func(**kwargs))
+            fmt_args = {k: "all" if v is None else v for k, v in kwargs.items()}
+            cache_key = key.format(**fmt_args)
+            try:
+                body = await cache.get(cache_key)
+            except RedisError as e:
+                logger.warning(f"Cache read failed for {cache_key}: {e}")
+                return as_response(await func(**kwargs))
+            response_etag = etag(**kwargs) if etag else None
+            if body is not None:
+                return cached_response(body, response_etag)
+            keep = stale_key is not None and (keep_stale is None or keep_stale(**kwargs))
+            stale_cache_key = f"stale:{stale_key.format(**fmt_args)}" if keep else None
+            try:
+                result = await func(**kwargs)
+            except PyMongoError:
+                try:
+                    stale = await cache.hgetall(stale_cache_key) if stale_cache_key else {}
+                except RedisError:
+                    stale = {}
+                if not stale:
+                    raise
+                logger.warning(f"MongoDB unavailable — serving {stale_cache_key}")
+                stale_etag = stale.get(b"etag")
+                return cached_response(stale[b"body"], stale_etag.decode() if stale_etag else None)
+            body = result.body if isinstance(result, Response) else orjson.dumps(result)
+            try:
+                async with cache.pipeline(transaction=False) as pipe:
+                    pipe.setex(cache_key, ttl, body)
+                    if stale_cache_key:
+                        stale = {"body": body}
+                        if response_etag:
+                            stale["etag"] = response_etag
+                        pipe.delete(stale_cache_key)
+                        pipe.hset(stale_cache_key, mapping=stale)
+                        pipe.expire(stale_cache_key, CACHE_STALE_TTL)
+                    await pipe.execute()
+            except RedisError as e:
+                logger.warning(f"Cache write failed for {cache_key}: {e}")
+            return cached_response(body, response_etag)
+        return wrapper
+    return decorator
+
+
+def cached_response(body: bytes, etag: Optional[str] = None) -> Response:
+    response = json_response(body)
+    if etag:
+        response.headers["ETag"] = etag
+    return response
+
+
+async def current_listings_version() -> int:
+    global listings_version, _listings_version_at
+    if time.monotonic() - _listings_version_at < LISTINGS_VERSION_TTL:
+        return listings_version
+    try:
+        meta = await db.meta.find_one({"_id": "listings_version"})
+    except PyMongoError as e:
+        # Keep answering with the last known version; the response cache
+        # still holds the matching bodies
+        logger.warning(f"Could not refresh listings version: {e}")
+        return listings_version
+    listings_version = meta["seq"] if meta else 0
+    _listings_version_at = time.monotonic()
+    return listings_version
+
+
+async def listings_changed():
+    """Record a listing write by bumping the listings version.
+
+    The version is part of every listing cache key, so this also retires
+    the cached responses; the old keys simply expire.
+    """
+    global listings_version, _listings_version_at
+    meta = await db.meta.find_one_and_update(
+        {"_id": "listings_version"},
+        {"$inc": {"seq": 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    listings_version = meta["seq"]
+    _listings_version_at = time.monotonic()
+
+
 # --- API Routes ---
 
 @app.get("/api/listings")
-async def get_listings(category: Optional[str] = Query(None)):
+async def get_listings(
+    request: Request,
+    category: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    after: Optional[str] = Query(None),
+):
+    version = await current_listings_version()
+    etag = listings_etag(version)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    # Only cache categories the site knows about, so arbitrary ?category=
+    # values can't fill Redis with keys
+    page = listings_page if await is_known_category(category) else listings_page.__wrapped__
+    response = await page(version=version, category=category, limit=limit, after=after)
+    # A stale fallback body arrives with the ETag of the version it was
+    # cached under; keep that one so clients revalidate once Mongo is back
+    response.headers.setdefault("ETag", etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def listings_etag(version: int) -> str:
+    """Weak ETag from the listings version, so unchanged polls skip the body.
+
+    ETags are compared per URL, so the version alone is enough.
+    """
+    return f'W/"{version}"'
+
+
+# Fresh entries are per version; the stale copy is not, so it survives the
+# version bump of a write. Later pages keep no stale copy: cursors are
+# unbounded, and the outage fallback only needs to cover first pages.
+@cached(
+    ttl=30,
+    key="listings:{version}:{category}:{limit}:{after}",
+    stale_key="listings:{category}:{limit}",
+    keep_stale=lambda after, **_: after is None,
+    etag=lambda version, **_: listings_etag(version),
+)
+async def listings_page(version: int, category: Optional[str], limit: int, after: Optional[str]) -> Response:
     query = {}
     if category and category != "all":
         query["category"] = category
-    cursor = db.listings.find(query).sort("sortOrder", 1)
-    listings = await cursor.to_list(length=200)
-    return [listing_to_dict(l) for l in listings]
+    if after:
+        query.update(decode_cursor(after))
+    # Raw batches come back as BSON bytes, decoded once per batch rather
+    # than once per document
+    cursor = db.listings.find_raw_batches(
+        query,
+        projection=LIST_PROJECTION,
+        sort=[("sortOrder", 1), ("_id", 1)],
+        limit=limit + 1,
+        batch_size=limit + 1,
+    )
+    listings = [l async for batch in cursor for l in decode_all(batch)]
+    next_cursor = encode_cursor(listings[limit - 1]) if len(listings) > limit else None
+    page = listings[:limit]
+    bodies = [listing_json(l) for l in page]
+    await backfill_cached_json(page, bodies)
+    return json_response(
+        b'{"items":[' + b",".join(bodies)
+        + b'],"nextCursor":' + orjson.dumps(next_cursor) + b"}"
+    )
+
+
+async def backfill_cached_json(listings, bodies):
+    """Store _cachedJson on listings that were read without it.
+
+    Each write only applies if sortOrder and updatedAt are still what was
+    read, so a concurrent edit or reorder is never overwritten with stale bytes.
+    """
+    ops = [
+        UpdateOne(
+            {
+                "_id": l["_id"],
+                "_cachedJson": {"$exists": False},
+                "sortOrder": l.get("sortOrder"),
+                "updatedAt": l.get("updatedAt"),
+            },
+            {"$set": {"_cachedJson": body}},
+        )
+        for l, body in zip(listings, bodies)
+        if "_cachedJson" not in l
+    ]
+    if not ops:
+        return
+    try:
+        await db.listings.bulk_write(ops, ordered=False)
+    except PyMongoError as e:
+        logger.warning(f"Could not backfill _cachedJson: {e}")
 
 
 @app.get("/api/listings/{listing_id}")
 async def get_listing(listing_id: str):
-    if not ObjectId.is_valid(listing_id):
-        raise HTTPException(status_code=404, detail="Listing not found")
-    listing = await db.listings.find_one({"_id": ObjectId(listing_id)})
+    return await listing_detail(version=await current_listings_version(), listing_id=listing_id)
+
+
+@cached(ttl=60, key="listing:{version}:{listing_id}", stale_key="listing:{listing_id}")
+async def listing_detail(version: int, listing_id: str):
+    oid = to_oid(listing_id)
+    listing = await db.listings.find_one({"_id": oid}, projection=DETAIL_PROJECTION)
     if not listing:
         raise HTTPException(status_code=404, detail="Listing not found")
     return listing_to_dict(listing)
@@ -155,10 +524,8 @@ async def get_listing(listing_id: str):
 
 @app.get("/api/categories")
 async def get_categories():
-    settings = await db.site_settings.find_one({"_id": "site"})
-    if settings and "categories" in settings:
-        return settings["categories"]
-    return DEFAULT_SETTINGS["categories"]
+    await refresh_settings_cache()
+    return json_response(_categories_cache)
 
 
 # --- Settings Routes ---
@@ -207,22 +574,57 @@ DEFAULT_SETTINGS = {
 }
 
 
+# Serialized /api/settings and /api/categories bodies. Rebuilt after
+# update_settings, and every SETTINGS_CACHE_TTL seconds so other worker
+# processes pick up changes too.
+SETTINGS_CACHE_TTL = 60
+_settings_cache: Optional[bytes] = None
+_categories_cache: Optional[bytes] = None
+_category_ids: frozenset = frozenset()
+_settings_cached_at = 0.0
+
+
+async def refresh_settings_cache():
+    global _settings_cache, _categories_cache, _category_ids, _settings_cached_at
+    if _settings_cache is not None and time.monotonic() - _settings_cached_at < SETTINGS_CACHE_TTL:
+        return
+    try:
+        settings = await db.site_settings.find_one({"_id": "site"}) or {}
+    except PyMongoError:
+        if _settings_cache is None:
+            raise
+        logger.warning("MongoDB unavailable — serving cached settings")
+        return
+    settings.pop("_id", None)
+    # Fill in any missing keys with defaults
+    settings = {**DEFAULT_SETTINGS, **settings}
+    _settings_cache = orjson.dumps(settings)
+    _categories_cache = orjson.dumps(settings["categories"])
+    _category_ids = frozenset(
+        c.get("id") for c in settings["categories"] if isinstance(c, dict)
+    )
+    _settings_cached_at = time.monotonic()
+
+
+async def is_known_category(category: Optional[str]) -> bool:
+    if category is None or category == "all":
+        return True
+    try:
+        await refresh_settings_cache()
+    except PyMongoError:
+        return False
+    return category in _category_ids
+
+
 @app.get("/api/settings")
 async def get_settings():
-    settings = await db.site_settings.find_one({"_id": "site"})
-    if settings:
-        settings.pop("_id", None)
-        # Fill in any missing keys with defaults
-        for key, val in DEFAULT_SETTINGS.items():
-            if key not in settings:
-                settings[key] = val
-        return settings
-    return DEFAULT_SETTINGS
-
-
-@app.put("/api/admin/settings")
-async def update_settings(request: Request, password: str = Query(...)):
-    verify_admin(password)
+    await refresh_settings_cache()
+    return json_response(_settings_cache)
+
+
+@app.put("/api/admin/settings", dependencies=[Depends(require_admin)])
+async def update_settings(request: Request):
+    global _settings_cache
     data = await request.json()
     data["updatedAt"] = datetime.utcnow().isoformat()
     await db.site_settings.update_one(
@@ -230,6 +632,7 @@ async def update_settings(request: Request, password: str = Query(...)):
         {"$set": data},
         upsert=True
     )
+    _settings_cache = None
     return {"ok": True}
 
 
@@ -241,14 +644,13 @@ async def admin_verify(auth: AdminAuth):
     return {"ok": True}
 
 
-@app.post("/api/admin/listings")
-async def create_listing(listing: ListingCreate, password: str = Query(...)):
-    verify_admin(password)
-    now = datetime.utcnow()
-    doc = listing.dict()
+@app.post("/api/admin/listings", dependencies=[Depends(require_admin)])
+async def create_listing(listing: ListingCreate):
+    now = utcnow()
+    doc = listing.model_dump()
     if doc.get("postedDate"):
         try:
-            doc["postedDate"] = datetime.fromisoformat(doc["postedDate"])
+            doc["postedDate"] = bson_datetime(datetime.fromisoformat(doc["postedDate"]))
         except (ValueError, TypeError):
             doc["postedDate"] = now
     else:
@@ -256,54 +658,55 @@ async def create_listing(listing: ListingCreate, password: str = Query(...)):
     doc["createdAt"] = now
     doc["updatedAt"] = now
     # Set sortOrder to end of list
-    max_order = await db.listings.find_one(sort=[("sortOrder", -1)])
-    doc["sortOrder"] = (max_order.get("sortOrder", 0) + 1) if max_order else 0
-    result = await db.listings.insert_one(doc)
-    created = await db.listings.find_one({"_id": result.inserted_id})
-    return listing_to_dict(created)
-
-
-@app.put("/api/admin/listings/{listing_id}")
-async def update_listing(listing_id: str, updates: ListingUpdate, password: str = Query(...)):
-    verify_admin(password)
-    if not ObjectId.is_valid(listing_id):
-        raise HTTPException(status_code=404, detail="Listing not found")
-    update_data = {k: v for k, v in updates.dict().items() if v is not None}
+    doc["sortOrder"] = await next_sort_order("listings_sortOrder")
+    doc["_id"] = ObjectId()
+    doc["_cachedJson"] = orjson.dumps(listing_to_list_dict(doc))
+    await db.listings.insert_one(doc)
+    await listings_changed()
+    return listing_to_dict(doc)
+
+
+@app.put("/api/admin/listings/{listing_id}", dependencies=[Depends(require_admin)])
+async def update_listing(listing_id: str, updates: ListingUpdate):
+    oid = to_oid(listing_id)
+    update_data = updates.model_dump(exclude_unset=True)
     if not update_data:
         raise HTTPException(status_code=400, detail="No fields to update")
     update_data["updatedAt"] = datetime.utcnow()
-    result = await db.listings.update_one(
-        {"_id": ObjectId(listing_id)},
-        {"$set": update_data}
+    updated = await db.listings.find_one_and_update(
+        {"_id": oid},
+        {"$set": update_data, "$unset": {"_cachedJson": ""}},
+        projection=DETAIL_PROJECTION,
+        return_document=ReturnDocument.AFTER
     )
-    if result.matched_count == 0:
+    if not updated:
         raise HTTPException(status_code=404, detail="Listing not found")
-    updated = await db.listings.find_one({"_id": ObjectId(listing_id)})
+    await listings_changed()
     return listing_to_dict(updated)
 
 
-@app.delete("/api/admin/listings/{listing_id}")
-async def delete_listing(listing_id: str, password: str = Query(...)):
-    verify_admin(password)
-    if not ObjectId.is_valid(listing_id):
-        raise HTTPException(status_code=404, detail="Listing not found")
-    result = await db.listings.delete_one({"_id": ObjectId(listing_id)})
+@app.delete("/api/admin/listings/{listing_id}", dependencies=[Depends(require_admin)])
+async def delete_listing(listing_id: str):
+    oid = to_oid(listing_id)
+    result = await db.listings.delete_one({"_id": oid})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Listing not found")
+    await listings_changed()
     return {"ok": True, "deleted": listing_id}
 
 
-@app.put("/api/admin/reorder")
-async def reorder_listings(request: Request, password: str = Query(...)):
-    verify_admin(password)
+@app.put("/api/admin/reorder", dependencies=[Depends(require_admin)])
+async def reorder_listings(request: Request):
     data = await request.json()
     order = data.get("order", [])  # list of listing IDs in desired order
-    for i, lid in enumerate(order):
-        if ObjectId.is_valid(lid):
-            await db.listings.update_one(
-                {"_id": ObjectId(lid)},
-                {"$set": {"sortOrder": i}}
-            )
+    oids = [to_oid(lid, 400, "Invalid listing id in order") for lid in order]
+    ops = [
+        UpdateOne({"_id": oid}, {"$set": {"sortOrder": i}, "$unset": {"_cachedJson": ""}})
+        for i, oid in enumerate(oids)
+    ]
+    if ops:
+        await db.listings.bulk_write(ops, ordered=False)
+    await listings_changed()
     return {"ok": True}
 
 
@@ -315,7 +718,7 @@ def mc_to_dict(mc) -> dict:
         "title": mc["title"],
         "fullText": mc["fullText"],
         "location": mc.get("location", "Colorado Springs, CO"),
-        "postedDate": mc["postedDate"].isoformat() if isinstance(mc["postedDate"], datetime) else mc["postedDate"],
+        "postedDate": mc["postedDate"],
         "sortOrder": mc.get("sortOrder", 999),
     }
 
@@ -324,81 +727,74 @@ def mc_to_dict(mc) -> dict:
 async def get_missed_connections():
     cursor = db.missed_connections.find().sort("sortOrder", 1)
     items = await cursor.to_list(length=200)
-    return [mc_to_dict(m) for m in items]
+    return ORJSONResponse([mc_to_dict(m) for m in items])
 
 
 @app.get("/api/missed-connections/{mc_id}")
 async def get_missed_connection(mc_id: str):
-    if not ObjectId.is_valid(mc_id):
-        raise HTTPException(status_code=404, detail="Not found")
-    mc = await db.missed_connections.find_one({"_id": ObjectId(mc_id)})
+    oid = to_oid(mc_id, detail="Not found")
+    mc = await db.missed_connections.find_one({"_id": oid})
     if not mc:
         raise HTTPException(status_code=404, detail="Not found")
-    return mc_to_dict(mc)
+    return ORJSONResponse(mc_to_dict(mc))
 
 
-@app.post("/api/admin/missed-connections")
-async def create_missed_connection(mc: MissedConnectionCreate, password: str = Query(...)):
-    verify_admin(password)
-    now = datetime.utcnow()
-    doc = mc.dict()
+@app.post("/api/admin/missed-connections", dependencies=[Depends(require_admin)])
+async def create_missed_connection(mc: MissedConnectionCreate):
+    now = utcnow()
+    doc = mc.model_dump()
     if doc.get("postedDate"):
         try:
-            doc["postedDate"] = datetime.fromisoformat(doc["postedDate"])
+            doc["postedDate"] = bson_datetime(datetime.fromisoformat(doc["postedDate"]))
         except (ValueError, TypeError):
             doc["postedDate"] = now
     else:
         doc["postedDate"] = now
     doc["createdAt"] = now
     doc["updatedAt"] = now
-    max_order = await db.missed_connections.find_one(sort=[("sortOrder", -1)])
-    doc["sortOrder"] = (max_order.get("sortOrder", 0) + 1) if max_order else 0
+    doc["sortOrder"] = await next_sort_order("missed_connections_sortOrder")
     result = await db.missed_connections.insert_one(doc)
-    created = await db.missed_connections.find_one({"_id": result.inserted_id})
-    return mc_to_dict(created)
+    doc["_id"] = result.inserted_id
+    return mc_to_dict(doc)
 
 
-@app.put("/api/admin/missed-connections/{mc_id}")
-async def update_missed_connection(mc_id: str, updates: MissedConnectionUpdate, password: str = Query(...)):
-    verify_admin(password)
-    if not ObjectId.is_valid(mc_id):
-        raise HTTPException(status_code=404, detail="Not found")
-    update_data = {k: v for k, v in updates.dict().items() if v is not None}
+@app.put("/api/admin/missed-connections/{mc_id}", dependencies=[Depends(require_admin)])
+async def update_missed_connection(mc_id: str, updates: MissedConnectionUpdate):
+    oid = to_oid(mc_id, detail="Not found")
+    update_data = updates.model_dump(exclude_unset=True)
     if not update_data:
         raise HTTPException(status_code=400, detail="No fields to update")
     update_data["updatedAt"] = datetime.utcnow()
-    result = await db.missed_connections.update_one(
-        {"_id": ObjectId(mc_id)},
-        {"$set": update_data}
+    updated = await db.missed_connections.find_one_and_update(
+        {"_id": oid},
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER
     )
-    if result.matched_count == 0:
+    if not updated:
         raise HTTPException(status_code=404, detail="Not found")
-    updated = await db.missed_connections.find_one({"_id": ObjectId(mc_id)})
     return mc_to_dict(updated)
 
 
-@app.delete("/api/admin/missed-connections/{mc_id}")
-async def delete_missed_connection(mc_id: str, password: str = Query(...)):
-    verify_admin(password)
-    if not ObjectId.is_valid(mc_id):
-        raise HTTPException(status_code=404, detail="Not found")
-    result = await db.missed_connections.delete_one({"_id": ObjectId(mc_id)})
+@app.delete("/api/admin/missed-connections/{mc_id}", dependencies=[Depends(require_admin)])
+async def delete_missed_connection(mc_id: str):
+    oid = to_oid(mc_id, detail="Not found")
+    result = await db.missed_connections.delete_one({"_id": oid})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Not found")
     return {"ok": True, "deleted": mc_id}
 
 
-@app.put("/api/admin/reorder-mc")
-async def reorder_missed_connections(request: Request, password: str = Query(...)):
-    verify_admin(password)
+@app.put("/api/admin/reorder-mc", dependencies=[Depends(require_admin)])
+async def reorder_missed_connections(request: Request):
     data = await request.json()
     order = data.get("order", [])
-    for i, mid in enumerate(order):
-        if ObjectId.is_valid(mid):
-            await db.missed_connections.update_one(
-                {"_id": ObjectId(mid)},
-                {"$set": {"sortOrder": i}}
-            )
+    oids = [to_oid(mid, 400, "Invalid id in order") for mid in order]
+    ops = [
+        UpdateOne({"_id": oid}, {"$set": {"sortOrder": i}})
+        for i, oid in enumerate(oids)
+    ]
+    if ops:
+        await db.missed_connections.bulk_write(ops, ordered=False)
     return {"ok": True}
 
 
@@ -468,9 +864,13 @@ async def seed_initial_data():
         },
     ]
 
+    now = utcnow()
+    mock_listings = [
+        {**listing, "_id": ObjectId(), "createdAt": now, "updatedAt": now, "sortOrder": i}
+        for i, listing in enumerate(mock_listings)
+    ]
     for listing in mock_listings:
-        listing["createdAt"] = datetime.utcnow()
-        listing["updatedAt"] = datetime.utcnow()
+        listing["_cachedJson"] = orjson.dumps(listing_to_list_dict(listing))
 
     await db.listings.insert_many(mock_listings)
     logger.info(f"Seeded {len(mock_listings)} listings")
@@ -480,20 +880,21 @@ async def seed_initial_data():
 
 # Mount static files
 STATIC_DIR = Path(__file__).parent / "static"
+INDEX_HTML = str(STATIC_DIR / "index.html")
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
 
-@app.get("/")
-async def serve_index():
-    return FileResponse(str(STATIC_DIR / "index.html"))
+class SPAStaticFiles(StaticFiles):
+    """StaticFiles that falls back to index.html for client-side routes."""
+
+    async def get_response(self, path: str, scope):
+        try:
+            return await super().get_response(path, scope)
+        except StarletteHTTPException as e:
+            if e.status_code != 404:
+                raise
+            return FileResponse(INDEX_HTML)
 
 
-# Catch-all for client-side routing (hash-based, but just in case)
-@app.get("/{path:path}")
-async def catch_all(path: str):
-    # Try to serve static file first
-    static_file = STATIC_DIR / path
-    if static_file.exists() and static_file.is_file():
-        return FileResponse(str(static_file))
-    # Otherwise serve index.html
-    return FileResponse(str(STATIC_DIR / "index.html"))
+# Mounted last so every /api route above takes precedence
+app.mount("/", SPAStaticFiles(directory=str(STATIC_DIR), html=True), name="spa")